@@ -20,9 +20,28 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import hashlib
+import math
+import multiprocessing
+import os
+import threading
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import IOBase
 from pathlib import Path
-from typing import Callable, List, Optional, Text, Tuple, Union
+from queue import Empty, Queue
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Text,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import torch
@@ -32,7 +51,7 @@ from einops import rearrange
 from pyannote.core import Segment, SlidingWindow, SlidingWindowFeature
 from pytorch_lightning.utilities.memory import is_oom_error
 
-from pyannote.audio.core.io import AudioFile
+from pyannote.audio.core.io import Audio, AudioFile
 from pyannote.audio.core.model import Model, Specifications
 from pyannote.audio.core.task import Resolution
 from pyannote.audio.utils.multi_task import map_with_specifications
@@ -44,6 +63,21 @@ class BaseInference:
     pass
 
 
+# inference instance used by `Inference.batch` worker processes
+_worker_inference: Optional["Inference"] = None
+
+
+def _init_worker(inference: "Inference"):
+    global _worker_inference
+    # one thread per worker process to avoid oversubscription
+    torch.set_num_threads(1)
+    _worker_inference = inference
+
+
+def _apply_in_worker(file: AudioFile):
+    return _worker_inference(file)
+
+
 class Inference(BaseInference):
     """Inference
 
@@ -181,6 +215,22 @@ class Inference(BaseInference):
 
         self.batch_size = batch_size
 
+        # whole file outputs, indexed by file uri (see `precompute`)
+        self.precomputed: Dict[
+            Text, Union[SlidingWindowFeature, Tuple[SlidingWindowFeature]]
+        ] = dict()
+
+        # (absolute path, channel) of the audio each precomputed uri was computed
+        # from, so that another file (or channel) sharing the same uri is not
+        # served its output
+        self._precomputed_source: Dict[Text, Tuple[Text, Optional[int]]] = dict()
+
+        # dtype requested when precomputing each uri (None for model output dtype)
+        self._precomputed_dtype: Dict[Text, Optional[np.dtype]] = dict()
+
+        # fingerprint of model weights (see `_precomputed_path`)
+        self._model_fingerprint: Optional[Text] = None
+
     def to(self, device: torch.device) -> "Inference":
         """Send internal model to `device`"""
 
@@ -292,28 +342,40 @@ class Inference(BaseInference):
             last_pad = window_size - last_window_size
             last_chunk = F.pad(last_chunk, (0, last_pad))
 
-        def __empty_list(**kwargs):
-            return list()
+        # outputs are written in place into arrays allocated once the shape of
+        # the first batch output is known (instead of stacking a list of batch
+        # outputs at the end, which requires twice as much memory)
+        outputs: Union[np.ndarray, Tuple[np.ndarray]] = None
 
-        outputs: Union[
-            List[np.ndarray], Tuple[List[np.ndarray]]
-        ] = map_with_specifications(self.model.specifications, __empty_list)
+        def __empty(batch_output: np.ndarray, **kwargs) -> np.ndarray:
+            return np.empty(
+                (num_chunks + has_last_chunk,) + batch_output.shape[1:],
+                dtype=batch_output.dtype,
+            )
+
+        def __write_batch(output, batch_output, start: int = 0, **kwargs) -> None:
+            output[start : start + len(batch_output)] = batch_output
+            return
 
         if hook is not None:
             hook(completed=0, total=num_chunks + has_last_chunk)
 
-        def __append_batch(output, batch_output, **kwargs) -> None:
-            output.append(batch_output)
-            return
-
         # slide over audio chunks in batch
         for c in np.arange(0, num_chunks, self.batch_size):
             batch: torch.Tensor = chunks[c : c + self.batch_size]
 
             batch_outputs: Union[np.ndarray, Tuple[np.ndarray]] = self.infer(batch)
 
+            if outputs is None:
+                outputs = map_with_specifications(
+                    self.model.specifications, __empty, batch_outputs
+                )
+
             _ = map_with_specifications(
-                self.model.specifications, __append_batch, outputs, batch_outputs
+                self.model.specifications,
+                partial(__write_batch, start=c),
+                outputs,
+                batch_outputs,
             )
 
             if hook is not None:
@@ -323,8 +385,16 @@ class Inference(BaseInference):
         if has_last_chunk:
             last_outputs = self.infer(last_chunk[None])
 
+            if outputs is None:
+                outputs = map_with_specifications(
+                    self.model.specifications, __empty, last_outputs
+                )
+
             _ = map_with_specifications(
-                self.model.specifications, __append_batch, outputs, last_outputs
+                self.model.specifications,
+                partial(__write_batch, start=num_chunks),
+                outputs,
+                last_outputs,
             )
 
             if hook is not None:
@@ -333,13 +403,6 @@ class Inference(BaseInference):
                     total=num_chunks + has_last_chunk,
                 )
 
-        def __vstack(output: List[np.ndarray], **kwargs) -> np.ndarray:
-            return np.vstack(output)
-
-        outputs: Union[np.ndarray, Tuple[np.ndarray]] = map_with_specifications(
-            self.model.specifications, __vstack, outputs
-        )
-
         def __aggregate(
             outputs: np.ndarray,
             frames: SlidingWindow,
@@ -376,10 +439,16 @@ class Inference(BaseInference):
             )
 
             # remove padding that was added to last chunk
+            # (same as aggregated.crop(Segment(0.0, duration), mode="loose") but
+            # slicing data directly instead of going through ranges and copies)
             if has_last_chunk:
-                aggregated.data = aggregated.crop(
-                    Segment(0.0, num_samples / sample_rate), mode="loose"
+                frames = aggregated.sliding_window
+                first = math.ceil((0.0 - frames.duration - frames.start) / frames.step)
+                last = (
+                    math.floor((num_samples / sample_rate - frames.start) / frames.step)
+                    + 1
                 )
+                aggregated.data = aggregated.data[max(0, first) : last]
 
             return aggregated
 
@@ -417,6 +486,19 @@ class Inference(BaseInference):
 
         waveform, sample_rate = self.model.audio(file)
 
+        return self._run(waveform, sample_rate, hook=hook)
+
+    def _run(
+        self,
+        waveform: torch.Tensor,
+        sample_rate: int,
+        hook: Optional[Callable] = None,
+    ) -> Union[
+        Tuple[Union[SlidingWindowFeature, np.ndarray]],
+        Union[SlidingWindowFeature, np.ndarray],
+    ]:
+        """Run inference on an already loaded waveform (see `__call__`)"""
+
         if self.window == "sliding":
             return self.slide(waveform, sample_rate, hook=hook)
 
@@ -429,6 +511,373 @@ class Inference(BaseInference):
             self.model.specifications, __first_sample, outputs
         )
 
+    def iterate(
+        self,
+        files: Iterable[AudioFile],
+        prefetch: int = 2,
+    ) -> Iterator[
+        Union[
+            Tuple[Union[SlidingWindowFeature, np.ndarray]],
+            Union[SlidingWindowFeature, np.ndarray],
+        ]
+    ]:
+        """Run inference on multiple files, loading audio in a background thread
+
+        While the model processes one file, the next `prefetch` files are read
+        (and resampled) by a background thread, hiding audio loading latency.
+
+        Parameters
+        ----------
+        files : iterable of AudioFile
+            Audio files.
+        prefetch : int, optional
+            Maximum number of loaded files waiting to be processed. Must be 1 or
+            more. Defaults to 2.
+
+        Yields
+        ------
+        output : (tuple of) SlidingWindowFeature or np.ndarray
+            Output of `__call__` for each file, in the same order as `files`.
+        """
+
+        # Queue(maxsize=0) is unbounded: all files would be loaded ahead of the model
+        if prefetch < 1:
+            raise ValueError(f"`prefetch` must be 1 or more (you used {prefetch}).")
+
+        fix_reproducibility(self.device)
+
+        loaded: Queue = Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def __load():
+            try:
+                for file in files:
+                    if stop.is_set():
+                        return
+                    waveform_and_sample_rate = self.model.audio(file)
+                    if stop.is_set():
+                        return
+                    loaded.put(waveform_and_sample_rate)
+            except Exception as exception:
+                loaded.put(exception)
+            else:
+                loaded.put(None)
+
+        loader = threading.Thread(target=__load, daemon=True)
+        loader.start()
+
+        try:
+            while True:
+                item = loaded.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                waveform, sample_rate = item
+                yield self._run(waveform, sample_rate)
+
+        finally:
+            # unblock loader thread in case iteration stopped early
+            stop.set()
+            while loader.is_alive():
+                try:
+                    loaded.get(timeout=0.1)
+                except Empty:
+                    pass
+
+    def batch(
+        self,
+        files: Iterable[AudioFile],
+        num_workers: Optional[int] = None,
+        chunksize: int = 1,
+    ) -> List[
+        Union[
+            Tuple[Union[SlidingWindowFeature, np.ndarray]],
+            Union[SlidingWindowFeature, np.ndarray],
+        ]
+    ]:
+        """Run inference on multiple files
+
+        Parameters
+        ----------
+        files : iterable of AudioFile
+            Audio files. They must be picklable (e.g. paths or {"audio": path}
+            dictionaries) when inference is distributed over worker processes.
+        num_workers : int, optional
+            Number of worker processes, each processing one file at a time.
+            Only used when running on CPU. Set to 0 to process files sequentially
+            in the main process (see `iterate`). Defaults to multiprocessing.cpu_count() // 2.
+        chunksize : int, optional
+            Number of files sent at once to each worker. Defaults to 1.
+
+        Returns
+        -------
+        outputs : list
+            Output of `__call__` for each file, in the same order as `files`.
+        """
+
+        files = list(files)
+
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count() // 2
+
+        num_workers = min(num_workers, len(files))
+
+        if num_workers < 2 or torch.device(self.device).type != "cpu":
+            return list(self.iterate(files))
+
+        # files provided as {"waveform": tensor, ...} are not copied through the
+        # pipe: torch registers its own reducers for tensors with multiprocessing
+        # ForkingPickler (used to send tasks to worker processes), which move
+        # their storage to shared memory and only send a handle to it.
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            return list(executor.map(_apply_in_worker, files, chunksize=chunksize))
+
+    def precompute(
+        self,
+        file: AudioFile,
+        hook: Optional[Callable] = None,
+        regenerate: bool = False,
+        dtype: Optional[np.dtype] = None,
+        cache_dir: Optional[Union[Text, Path]] = None,
+    ) -> Union[SlidingWindowFeature, Tuple[SlidingWindowFeature]]:
+        """Run inference on a whole file and keep its output for subsequent `crop` calls
+
+        Parameters
+        ----------
+        file : AudioFile
+            Audio file.
+        hook : callable, optional
+            See `__call__`.
+        regenerate : bool, optional
+            Run inference again even if `file` has already been precomputed
+            (which is also the case when it was precomputed with another `dtype`).
+        dtype : np.dtype, optional
+            Store precomputed output with this (lower precision) dtype, e.g.
+            np.float16 to halve its memory footprint. Outputs returned by `crop`
+            are converted back to float32. Defaults to keeping model output as is.
+        cache_dir : str or Path, optional
+            Also persist precomputed output to this directory, so that later runs
+            (e.g. other trials of a hyper-parameter search) load it from disk
+            instead of running inference again. Cached outputs are indexed by file
+            "uri" and by a hash of the audio file (path, channel, size and
+            modification time), of the model (architecture and weights) and of
+            the inference configuration. Set `regenerate` to overwrite them.
+            Not supported with `pre_aggregation_hook`. Defaults to in-memory
+            storage only.
+
+        Returns
+        -------
+        output : (tuple of) SlidingWindowFeature
+            Precomputed model output.
+
+        Notes
+        -----
+        Once a file has been precomputed, `crop` no longer runs the model on
+        this file but returns the corresponding part of the whole file output.
+        As frames are then aligned on the whole file and benefit from context
+        outside of the requested chunk, this might slightly differ from running
+        the model on the chunk alone.
+
+        Precomputed outputs are stored in `precomputed` attribute, indexed by
+        file "uri". Delete the corresponding entry to free memory. Only files
+        provided as paths (e.g. {"audio": path}) can be precomputed: in-memory
+        waveforms and file-like objects cannot be told apart by their "uri".
+        """
+
+        if (
+            self.window != "sliding"
+            or self.skip_aggregation
+            or any(
+                s.resolution == Resolution.CHUNK
+                or (s.permutation_invariant and self.pre_aggregation_hook is None)
+                for s in self.model.specifications
+            )
+        ):
+            raise ValueError(
+                "Precomputation is only supported for aggregated frame-level outputs "
+                '(i.e. with "sliding" window and without `skip_aggregation`).'
+            )
+
+        file = Audio.validate_file(file)
+        if "waveform" in file or isinstance(file["audio"], IOBase):
+            raise ValueError(
+                "Precomputation is only supported for files provided as paths "
+                '(e.g. {"audio": "/path/to/audio.wav"}).'
+            )
+
+        uri = file["uri"]
+        dtype = None if dtype is None else np.dtype(dtype)
+        if (
+            not regenerate
+            and self._precomputed_uri(file) is not None
+            and self._precomputed_dtype[uri] == dtype
+        ):
+            return self.precomputed[uri]
+
+        audio = os.path.abspath(file["audio"])
+        source = (audio, file.get("channel"))
+
+        path = None
+        if cache_dir is not None:
+            # arbitrary callables cannot be reliably identified across runs
+            if self.pre_aggregation_hook is not None:
+                raise ValueError(
+                    "Caching precomputed output to disk (`cache_dir`) is not "
+                    "supported with `pre_aggregation_hook`."
+                )
+
+            path = self._precomputed_path(
+                cache_dir, uri, audio, channel=file.get("channel"), dtype=dtype
+            )
+            if not regenerate and path.is_file():
+                self.precomputed[uri] = self._load_precomputed(path)
+                self._precomputed_source[uri] = source
+                self._precomputed_dtype[uri] = dtype
+                return self.precomputed[uri]
+
+        outputs = self(file, hook=hook)
+
+        if dtype is not None:
+
+            def __astype(
+                output: SlidingWindowFeature, **kwargs
+            ) -> SlidingWindowFeature:
+                return SlidingWindowFeature(
+                    output.data.astype(dtype),
+                    output.sliding_window,
+                    labels=output.labels,
+                )
+
+            outputs = map_with_specifications(
+                self.model.specifications, __astype, outputs
+            )
+
+        if path is not None:
+            self._save_precomputed(path, outputs)
+
+        self.precomputed[uri] = outputs
+        self._precomputed_source[uri] = source
+        self._precomputed_dtype[uri] = dtype
+
+        return self.precomputed[uri]
+
+    def _precomputed_uri(self, file: AudioFile) -> Optional[Text]:
+        """Return `file` uri if its output was precomputed, None otherwise"""
+
+        # do not validate `file` on every single crop when nothing was precomputed
+        if not self.precomputed:
+            return None
+
+        file = Audio.validate_file(file)
+        uri = file["uri"]
+        if uri not in self.precomputed or "waveform" in file:
+            return None
+
+        audio = file["audio"]
+        if isinstance(audio, IOBase):
+            return None
+
+        source = (os.path.abspath(audio), file.get("channel"))
+        if self._precomputed_source.get(uri) != source:
+            return None
+
+        return uri
+
+    def _precomputed_path(
+        self,
+        cache_dir: Union[Text, Path],
+        uri: Text,
+        audio: Text,
+        channel: Optional[int] = None,
+        dtype: Optional[np.dtype] = None,
+    ) -> Path:
+        """Path to on-disk cache of `uri` precomputed output (see `precompute`)
+
+        `audio` (absolute path of the audio file) and `channel` are part of the
+        hash so that files (or channels) sharing the same "uri" (e.g. same stem)
+        do not share cache entries. So are the size and modification time of
+        `audio`, so that replacing the audio file invalidates its entries.
+        """
+
+        # model weights are assumed not to change during the lifetime of
+        # this Inference instance (model is in eval mode): hash them only once
+        if self._model_fingerprint is None:
+            fingerprint = hashlib.sha1()
+            for name, tensor in self.model.state_dict().items():
+                fingerprint.update(name.encode())
+                fingerprint.update(tensor.detach().float().cpu().numpy().tobytes())
+            self._model_fingerprint = fingerprint.hexdigest()
+
+        stat = os.stat(audio)
+        config = repr(
+            (
+                audio,
+                channel,
+                stat.st_size,
+                stat.st_mtime_ns,
+                self._model_fingerprint,
+                self.model.__class__.__name__,
+                dict(self.model.hparams),
+                self.duration,
+                self.step,
+                self.warm_up,
+                self.skip_conversion,
+                None if dtype is None else np.dtype(dtype).str,
+            )
+        )
+        config_hash = hashlib.sha1(config.encode()).hexdigest()[:8]
+
+        return Path(cache_dir) / f"{uri}.{config_hash}.npz"
+
+    def _save_precomputed(
+        self,
+        path: Path,
+        outputs: Union[SlidingWindowFeature, Tuple[SlidingWindowFeature]],
+    ):
+        """Save precomputed output to disk (see `precompute`)"""
+
+        if isinstance(outputs, SlidingWindowFeature):
+            outputs = (outputs,)
+
+        arrays = dict()
+        for o, output in enumerate(outputs):
+            frames = output.sliding_window
+            arrays[f"data{o:d}"] = output.data
+            arrays[f"frames{o:d}"] = np.array(
+                [frames.start, frames.duration, frames.step]
+            )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first so that concurrent readers
+        # never see a partially written cache file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid():d}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    def _load_precomputed(
+        self, path: Path
+    ) -> Union[SlidingWindowFeature, Tuple[SlidingWindowFeature]]:
+        """Load precomputed output from disk (see `precompute`)"""
+
+        outputs = []
+        with np.load(path) as arrays:
+            for o in range(len(arrays.files) // 2):
+                start, duration, step = arrays[f"frames{o:d}"].tolist()
+                frames = SlidingWindow(start=start, duration=duration, step=step)
+                outputs.append(SlidingWindowFeature(arrays[f"data{o:d}"], frames))
+
+        if isinstance(self.model.specifications, Specifications):
+            return outputs[0]
+
+        return tuple(outputs)
+
     def crop(
         self,
         file: AudioFile,
@@ -485,39 +934,81 @@ class Inference(BaseInference):
                 end = max(c.end for c in chunk)
                 chunk = Segment(start=start, end=end)
 
+            uri = self._precomputed_uri(file)
+            if uri is not None:
+
+                def __crop(
+                    output: SlidingWindowFeature, **kwargs
+                ) -> SlidingWindowFeature:
+                    # same as output.crop(chunk, mode="loose", fixed=duration)
+                    # but slicing data directly instead of going through ranges
+                    frames = output.sliding_window
+                    num_frames = len(output.data)
+
+                    start = math.ceil(
+                        (chunk.start - frames.duration - frames.start) / frames.step
+                    )
+
+                    if duration is None:
+                        end = math.floor((chunk.end - frames.start) / frames.step) + 1
+                        start, end = max(0, start), min(num_frames, end)
+                        indices = slice(start, end)
+
+                    else:
+                        end = start + frames.samples(duration, mode="loose")
+                        if start < 0 or end > num_frames:
+                            # repeat first (or last) frame when out of bounds
+                            indices = np.clip(np.arange(start, end), 0, num_frames - 1)
+                        else:
+                            indices = slice(start, end)
+
+                    # always copy (and convert back to float32 in case output was
+                    # precomputed with lower precision), so that modifying the
+                    # cropped output in place does not corrupt precomputed output
+                    data = np.array(output.data[indices], dtype=np.float32)
+
+                    cropped_frames = SlidingWindow(
+                        start=frames.start + start * frames.step,
+                        duration=frames.duration,
+                        step=frames.step,
+                    )
+                    return SlidingWindowFeature(
+                        data, cropped_frames, labels=output.labels
+                    )
+
+                return map_with_specifications(
+                    self.model.specifications, __crop, self.precomputed[uri]
+                )
+
             waveform, sample_rate = self.model.audio.crop(
                 file, chunk, duration=duration
             )
-            outputs: Union[
-                SlidingWindowFeature, Tuple[SlidingWindowFeature]
-            ] = self.slide(waveform, sample_rate, hook=hook)
-
-            def __shift(output: SlidingWindowFeature, **kwargs) -> SlidingWindowFeature:
-                frames = output.sliding_window
-                shifted_frames = SlidingWindow(
-                    start=chunk.start, duration=frames.duration, step=frames.step
-                )
-                return SlidingWindowFeature(output.data, shifted_frames)
 
-            return map_with_specifications(self.model.specifications, __shift, outputs)
-
-        if isinstance(chunk, Segment):
+        elif isinstance(chunk, Segment):
             waveform, sample_rate = self.model.audio.crop(
                 file, chunk, duration=duration
             )
+
         else:
-            waveform = torch.cat(
-                [self.model.audio.crop(file, c)[0] for c in chunk], dim=1
-            )
+            # read the union of all chunks only once
+            waveforms, sample_rate = self.model.audio.crop_batch(file, chunk)
+            waveform = torch.cat(waveforms, dim=1)
 
-        outputs: Union[np.ndarray, Tuple[np.ndarray]] = self.infer(waveform[None])
+        outputs = self._run(waveform, sample_rate, hook=hook)
 
-        def __first_sample(outputs: np.ndarray, **kwargs) -> np.ndarray:
-            return outputs[0]
+        if self.window == "whole":
+            return outputs
 
-        return map_with_specifications(
-            self.model.specifications, __first_sample, outputs
-        )
+        def __shift(output: SlidingWindowFeature, **kwargs) -> SlidingWindowFeature:
+            # output is not shared with anyone else: shift it in place
+            # rather than wrapping its data into yet another SlidingWindowFeature
+            frames = output.sliding_window
+            output.sliding_window = SlidingWindow(
+                start=chunk.start, duration=frames.duration, step=frames.step
+            )
+            return output
+
+        return map_with_specifications(self.model.specifications, __shift, outputs)
 
     @staticmethod
     def aggregate(
@@ -609,23 +1100,43 @@ class Inference(BaseInference):
             (num_frames, num_classes), dtype=np.float32
         )
 
+        # NaNs and infinite values propagate through summation: one single
+        # reduction is enough to know whether NaN masks (and clamping of infinite
+        # values) are needed at all, which is rarely the case
+        has_non_finite = not np.isfinite(np.sum(scores.data))
+
+        # frame-wise weight shared by all chunks
+        window = hamming_window * warm_up_window
+
+        # index of the first frame of each chunk, computed in one vectorized pass
+        # rather than with one call to `frames.closest_frame` per chunk
+        # (same arithmetic as `closest_frame(chunk.start + 0.5 * frames.duration)`)
+        chunk_starts = (
+            scores.sliding_window.start
+            + np.arange(num_chunks) * scores.sliding_window.step
+        )
+        half_frame = 0.5 * frames.duration
+        start_frames = np.rint(
+            (chunk_starts + half_frame - frames.start - half_frame) / frames.step
+        ).astype(int)
+
         # loop on the scores of sliding chunks
-        for chunk, score in scores:
-            # chunk ~ Segment
+        for score, start_frame in zip(scores.data, start_frames):
             # score ~ (num_frames_per_chunk, num_classes)-shaped np.ndarray
             # mask ~ (num_frames_per_chunk, num_classes)-shaped np.ndarray
-            mask = 1 - np.isnan(score)
-            np.nan_to_num(score, copy=False, nan=0.0)
-            
-            start_frame = frames.closest_frame(chunk.start + 0.5 * frames.duration)
+            if has_non_finite:
+                mask = 1 - np.isnan(score)
+                np.nan_to_num(score, copy=False, nan=0.0)
+            else:
+                mask = 1.0
 
             aggregated_output[start_frame : start_frame + num_frames_per_chunk] += (
-                score * mask * hamming_window * warm_up_window
+                score * mask * window
             )
 
             overlapping_chunk_count[
                 start_frame : start_frame + num_frames_per_chunk
-            ] += (mask * hamming_window * warm_up_window)
+            ] += (mask * window)
 
             aggregated_mask[
                 start_frame : start_frame + num_frames_per_chunk
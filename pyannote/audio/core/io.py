@@ -28,13 +28,17 @@ pyannote.audio relies on torchaudio for reading and resampling.
 """
 
 import math
+import os
 import random
 import warnings
+from collections import OrderedDict
 from io import IOBase
 from pathlib import Path
-from typing import Mapping, Optional, Text, Tuple, Union
+from typing import List, Mapping, Optional, Text, Tuple, Union
 
 import numpy as np
+import soundfile
+import torch
 import torch.nn.functional as F
 import torchaudio
 from pyannote.core import Segment
@@ -105,6 +109,17 @@ class Audio:
     backend : str
         torchaudio backend to use. Defaults to 'soundfile' if available,
         or the first available backend.
+    cache_size : int, optional
+        Keep that many decoded files in memory (least recently used ones are
+        evicted first), so that repeated calls to `crop` on the same file slice
+        the cached waveform instead of reading it from disk again. This is
+        mostly useful when many (possibly overlapping) chunks are cropped from
+        the same few files. Defaults to 0 (no caching).
+    reuse_frames : bool, optional
+        Keep frames read by the last call to `crop`, so that the next one only
+        reads the missing frames when both chunks overlap. This is mostly useful
+        when cropping consecutive overlapping chunks of the same file (e.g.
+        sliding windows). Defaults to False.
 
     Usage
     -----
@@ -190,7 +205,9 @@ class Audio:
                 return file
 
             path = Path(file["audio"])
-            if not path.is_file():
+            # skip existence check (i.e. one filesystem call for every single crop)
+            # when file metadata is already known, as file has been found before.
+            if "torchaudio.info" not in file and not path.is_file():
                 raise ValueError(f"File {path} does not exist")
 
             file.setdefault("uri", path.stem)
@@ -202,7 +219,14 @@ class Audio:
 
         return file
 
-    def __init__(self, sample_rate: int = None, mono=None, backend: str = None):
+    def __init__(
+        self,
+        sample_rate: int = None,
+        mono=None,
+        backend: str = None,
+        cache_size: int = 0,
+        reuse_frames: bool = False,
+    ):
         super().__init__()
         self.sample_rate = sample_rate
         self.mono = mono
@@ -215,6 +239,119 @@ class Audio:
 
         self.backend = backend
 
+        self.cache_size = cache_size
+        # path -> ((path, size, mtime), waveform, sample_rate)
+        self._cache: OrderedDict[
+            Text, Tuple[Tuple[Text, int, int], Tensor, int]
+        ] = OrderedDict()
+
+        self.reuse_frames = reuse_frames
+        # ((path, size, mtime), start_frame, data) of last seek-and-read
+        # (see `_load_frames`)
+        self._last_read: Optional[Tuple[Tuple[Text, int, int], int, Tensor]] = None
+
+    def _load_cached(self, path: Text) -> Tuple[Tensor, int]:
+        """Load (and cache) original waveform and sample rate of `path`
+
+        Cached waveforms are keyed on file path, size and modification time (as
+        frames reused by `_load_frames`), so that a file rewritten in place is
+        loaded again. Callers must not modify the returned waveform in place.
+        """
+
+        path = str(path)
+        key = self._frames_key(path)
+
+        if path in self._cache:
+            cached_key, waveform, sample_rate = self._cache[path]
+            if cached_key == key:
+                self._cache.move_to_end(path)
+                return waveform, sample_rate
+
+        waveform, sample_rate = torchaudio.load(path, backend=self.backend)
+
+        self._cache[path] = (key, waveform, sample_rate)
+        self._cache.move_to_end(path)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return waveform, sample_rate
+
+    def _load_frames(self, path: Text, start_frame: int, num_frames: int) -> Tensor:
+        """Seek-and-read original frames of `path`
+
+        When `reuse_frames` is set (or within `crop_batch`), consecutive crops
+        of the same file often overlap (e.g. sliding windows): frames already
+        read by the previous call are reused and only the missing ones are
+        actually read from disk. Reuse is keyed on file path, size and
+        modification time, so that a file rewritten in place is read again.
+        Returned tensors never share memory with the reused frames.
+        """
+
+        path = str(path)
+
+        # random-access crops (e.g. training) hardly ever overlap: do not pay
+        # for a stat and a copy of every crop for reuse that will not happen
+        if self._last_read is None and not self.reuse_frames:
+            return self._read_frames(path, start_frame, num_frames)
+
+        end_frame = start_frame + num_frames
+
+        key = self._frames_key(path)
+
+        if self._last_read is not None:
+            last_key, last_start_frame, last_data = self._last_read
+            last_end_frame = last_start_frame + last_data.shape[1]
+
+            if last_key == key and last_start_frame <= start_frame <= last_end_frame:
+                offset = start_frame - last_start_frame
+
+                if end_frame <= last_end_frame:
+                    return last_data[:, offset : offset + num_frames].clone()
+
+                missing_data = self._read_frames(
+                    path, last_end_frame, end_frame - last_end_frame
+                )
+                data = torch.cat([last_data[:, offset:], missing_data], dim=1)
+                self._last_read = (key, start_frame, data)
+                return data.clone()
+
+        data = self._read_frames(path, start_frame, num_frames)
+        self._last_read = (key, start_frame, data)
+        return data.clone()
+
+    @staticmethod
+    def _frames_key(path: Text) -> Tuple[Text, int, int]:
+        """Identify content of `path` (see `_load_cached` and `_load_frames`)"""
+        stat = os.stat(path)
+        return (path, stat.st_size, stat.st_mtime_ns)
+
+    def _read_frames(self, path: Text, start_frame: int, num_frames: int) -> Tensor:
+        """Windowed read of `num_frames` original frames of `path`
+
+        With "soundfile" backend, the file is read directly with `soundfile`:
+        it seeks to `start_frame` and only decodes the requested frames, without
+        going through torchaudio backend dispatch on every call.
+        """
+
+        if self.backend != "soundfile":
+            data, _ = torchaudio.load(
+                path,
+                frame_offset=start_frame,
+                num_frames=num_frames,
+                backend=self.backend,
+            )
+            return data
+
+        with soundfile.SoundFile(path, "r") as f:
+            f.seek(start_frame)
+            data = f.read(num_frames, dtype="float32", always_2d=True)
+        # data: (time, channel) np.ndarray
+
+        return torch.from_numpy(data).t().contiguous()
+
+    def _is_cacheable(self, file: Mapping) -> bool:
+        return self.cache_size > 0 and not isinstance(file["audio"], IOBase)
+
     def downmix_and_resample(self, waveform: Tensor, sample_rate: int) -> Tensor:
         """Downmix and resample
 
@@ -271,6 +408,10 @@ class Audio:
             frames = len(file["waveform"].T)
             sample_rate = file["sample_rate"]
 
+        elif self._is_cacheable(file) and str(file["audio"]) in self._cache:
+            waveform, sample_rate = self._load_cached(file["audio"])
+            frames = waveform.shape[1]
+
         else:
             if "torchaudio.info" in file:
                 info = file["torchaudio.info"]
@@ -321,6 +462,12 @@ class Audio:
             waveform = file["waveform"]
             sample_rate = file["sample_rate"]
 
+        elif self._is_cacheable(file):
+            # do not hand out cached waveform (which would be corrupted by
+            # in-place operations of the caller)
+            waveform, sample_rate = self._load_cached(file["audio"])
+            waveform = waveform.clone()
+
         elif "audio" in file:
             waveform, sample_rate = torchaudio.load(file["audio"], backend=self.backend)
 
@@ -369,11 +516,19 @@ class Audio:
         """
         file = self.validate_file(file)
 
+        waveform = None
+        cached = False
+
         if "waveform" in file:
             waveform = file["waveform"]
             frames = waveform.shape[1]
             sample_rate = file["sample_rate"]
 
+        elif self._is_cacheable(file):
+            waveform, sample_rate = self._load_cached(file["audio"])
+            frames = waveform.shape[1]
+            cached = True
+
         elif "torchaudio.info" in file:
             info = file["torchaudio.info"]
             frames = info.num_frames
@@ -426,20 +581,25 @@ class Audio:
             end_frame = min(end_frame, frames)
             num_frames = end_frame - start_frame
 
-        if "waveform" in file:
-            data = file["waveform"][:, start_frame:end_frame]
+        if waveform is not None:
+            data = waveform[:, start_frame:end_frame]
+            # do not hand out a view of cached waveform (see `__call__`)
+            if cached:
+                data = data.clone()
 
         else:
             try:
-                data, _ = torchaudio.load(
-                    file["audio"],
-                    frame_offset=start_frame,
-                    num_frames=num_frames,
-                    backend=self.backend,
-                )
-                # rewind if needed
                 if isinstance(file["audio"], IOBase):
+                    data, _ = torchaudio.load(
+                        file["audio"],
+                        frame_offset=start_frame,
+                        num_frames=num_frames,
+                        backend=self.backend,
+                    )
+                    # rewind
                     file["audio"].seek(0)
+                else:
+                    data = self._load_frames(file["audio"], start_frame, num_frames)
             except RuntimeError:
                 if isinstance(file["audio"], IOBase):
                     msg = "torchaudio failed to seek-and-read in file-like object."
@@ -468,3 +628,91 @@ class Audio:
             data = F.pad(data, (pad_start, pad_end))
 
         return self.downmix_and_resample(data, sample_rate)
+
+    def crop_batch(
+        self,
+        file: AudioFile,
+        segments: List[Segment],
+        duration: Optional[float] = None,
+        mode="raise",
+    ) -> Tuple[List[Tensor], int]:
+        """Extract multiple chunks of the same file
+
+        Equivalent to calling `crop` on each segment, except that file metadata
+        is probed only once and that overlapping (or nearly adjacent) segments
+        are grouped, each group being read at once. Each segment is then sliced
+        out of the read of its group. Segments far apart are read separately.
+
+        Parameters
+        ----------
+        file : AudioFile
+            Audio file.
+        segments : list of `pyannote.core.Segment`
+            Temporal segments to load.
+        duration : float, optional
+            See `crop`.
+        mode : {'raise', 'pad'}, optional
+            See `crop`.
+
+        Returns
+        -------
+        waveforms : list of (channel, time) torch.Tensor
+            Waveform of each segment
+        sample_rate : int
+            Sample rate
+        """
+
+        # copy so that metadata probed below does not leak into caller's file
+        file = dict(self.validate_file(file))
+
+        seek_and_read = (
+            len(segments) > 0
+            and "waveform" not in file
+            and not self._is_cacheable(file)
+            and not isinstance(file["audio"], IOBase)
+        )
+
+        if seek_and_read and "torchaudio.info" not in file:
+            file["torchaudio.info"] = get_torchaudio_info(file, backend=self.backend)
+
+        # a segment joins the current group when it starts less than its own
+        # duration after the end of the group, and starts a new group otherwise
+        # (so that frames between far apart segments are not read for nothing)
+        groups: List[Tuple[float, float, List[int]]] = []
+        for s in sorted(range(len(segments)), key=lambda s: segments[s].start):
+            start = segments[s].start
+            end = start + duration if duration else segments[s].end
+            if groups and start - groups[-1][1] < end - start:
+                group_start, group_end, indices = groups[-1]
+                groups[-1] = (group_start, max(group_end, end), indices + [s])
+            else:
+                groups.append((start, end, [s]))
+
+        sample_rate = self.sample_rate
+        waveforms: List[Tensor] = [None] * len(segments)
+        for start, end, indices in groups:
+            if seek_and_read:
+                info = file["torchaudio.info"]
+                start_frame = max(0, math.floor(start * info.sample_rate))
+                end_frame = min(info.num_frames, math.ceil(end * info.sample_rate) + 1)
+
+                # crops of this group are sliced out of this read
+                # (see `_load_frames`)
+                if end_frame > start_frame:
+                    path = str(file["audio"])
+                    self._last_read = (
+                        self._frames_key(path),
+                        start_frame,
+                        self._read_frames(path, start_frame, end_frame - start_frame),
+                    )
+
+            for s in indices:
+                waveforms[s], sample_rate = self.crop(
+                    file, segments[s], duration=duration, mode=mode
+                )
+
+        # do not keep the (possibly large) read of the last group alive
+        if seek_and_read:
+            self._last_read = None
+
+        return waveforms, sample_rate
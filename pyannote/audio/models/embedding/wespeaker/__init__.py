@@ -150,13 +150,25 @@ class BaseWeSpeakerResNet(Model):
             padding=0,
             dilation=1,
         )
-        return features - F.avg_pool1d(
-            features.transpose(1, 2),
-            kernel_size=2 * (kernel_size // 2) + 1,
-            stride=1,
-            padding=kernel_size // 2,
-            count_include_pad=False,
-        ).transpose(1, 2)
+
+        # same as F.avg_pool1d(kernel_size=2 * half + 1, stride=1, padding=half,
+        # count_include_pad=False) but window sums are obtained from cumulative
+        # sums shared by all overlapping windows, instead of being recomputed
+        # from scratch for every single frame
+        half = kernel_size // 2
+        num_frames = features.shape[1]
+
+        # accumulate in float64 to limit rounding errors (not supported by MPS)
+        dtype = torch.float32 if device.type == "mps" else torch.float64
+        cumsum = F.pad(torch.cumsum(features, dim=1, dtype=dtype), (0, 0, 1, 0))
+        # (batch_size, 1 + num_frames, num_mel_bins)
+
+        frames = torch.arange(num_frames, device=features.device)
+        start = torch.clamp(frames - half, min=0)
+        end = torch.clamp(frames + half + 1, max=num_frames)
+        means = (cumsum[:, end] - cumsum[:, start]) / (end - start)[:, None]
+
+        return features - means.to(features.dtype)
 
     @property
     def dimension(self) -> int:
@@ -167,7 +167,12 @@ class SpeakerDiarization(SpeakerDiarizationMixin, Pipeline):
             self._embedding = PretrainedSpeakerEmbedding(
                 self.embedding, use_auth_token=use_auth_token
             )
-            self._audio = Audio(sample_rate=self._embedding.sample_rate, mono="downmix")
+            # embeddings are extracted from overlapping sliding chunks
+            self._audio = Audio(
+                sample_rate=self._embedding.sample_rate,
+                mono="downmix",
+                reuse_frames=True,
+            )
             metric = self._embedding.metric
 
         try:
@@ -281,9 +286,12 @@ class SpeakerDiarization(SpeakerDiarizationMixin, Pipeline):
             min_num_frames = math.ceil(num_frames * min_num_samples / num_samples)
 
             # zero-out frames with overlapping speech
-            clean_frames = 1.0 * (
+            # (clean_frames is float32 so that it does not promote float32
+            # segmentations; float64 ones, as returned by binarize, stay
+            # float64 until masks are converted to float32 below)
+            clean_frames = (
                 np.sum(binary_segmentations.data, axis=2, keepdims=True) < 2
-            )
+            ).astype(np.float32)
             clean_segmentations = SlidingWindowFeature(
                 binary_segmentations.data * clean_frames,
                 binary_segmentations.sliding_window,
@@ -295,12 +303,31 @@ class SpeakerDiarization(SpeakerDiarizationMixin, Pipeline):
                 binary_segmentations.data, binary_segmentations.sliding_window
             )
 
+        # store masks speaker-major, i.e. (num_chunks, num_speakers, num_frames),
+        # so that each (chunk, speaker) mask is a contiguous row rather than a
+        # strided column of its (num_frames, num_speakers) chunk. transposition
+        # and float32 conversion happen in the same (always copying) pass and
+        # NaNs (in case of partial stitching) are then zeroed in place, once
+        # for the whole file rather than once per chunk.
+        masks_by_speaker = np.array(
+            np.transpose(binary_segmentations.data, (0, 2, 1)),
+            dtype=np.float32,
+            order="C",
+        )
+        np.nan_to_num(masks_by_speaker, copy=False, nan=0.0)
+        clean_masks_by_speaker = np.array(
+            np.transpose(clean_segmentations.data, (0, 2, 1)),
+            dtype=np.float32,
+            order="C",
+        )
+        np.nan_to_num(clean_masks_by_speaker, copy=False, nan=0.0)
+
         def iter_waveform_and_mask():
-            for (chunk, masks), (_, clean_masks) in zip(
-                binary_segmentations, clean_segmentations
+            for (chunk, _), masks, clean_masks in zip(
+                binary_segmentations, masks_by_speaker, clean_masks_by_speaker
             ):
                 # chunk: Segment(t, t + duration)
-                # masks: (num_frames, local_num_speakers) np.ndarray
+                # masks: (local_num_speakers, num_frames) np.ndarray
 
                 waveform, _ = self._audio.crop(
                     file,
@@ -310,11 +337,7 @@ class SpeakerDiarization(SpeakerDiarizationMixin, Pipeline):
                 )
                 # waveform: (1, num_samples) torch.Tensor
 
-                # mask may contain NaN (in case of partial stitching)
-                masks = np.nan_to_num(masks, nan=0.0).astype(np.float32)
-                clean_masks = np.nan_to_num(clean_masks, nan=0.0).astype(np.float32)
-
-                for mask, clean_mask in zip(masks.T, clean_masks.T):
+                for mask, clean_mask in zip(masks, clean_masks):
                     # mask: (num_frames, ) np.ndarray
 
                     if np.sum(clean_mask) > min_num_frames:
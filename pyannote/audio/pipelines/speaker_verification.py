@@ -21,7 +21,7 @@
 # SOFTWARE.
 
 import warnings
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
 from typing import Optional, Text, Union
 
@@ -537,21 +537,24 @@ class ONNXWeSpeakerPretrainedSpeakerEmbedding(BaseInference):
         """
 
         waveforms = waveforms * (1 << 15)
-        features = torch.stack(
-            [
-                kaldi.fbank(
-                    waveform,
-                    num_mel_bins=num_mel_bins,
-                    frame_length=frame_length,
-                    frame_shift=frame_shift,
-                    dither=dither,
-                    sample_frequency=self.sample_rate,
-                    window_type="hamming",
-                    use_energy=False,
-                )
-                for waveform in waveforms
-            ]
-        )
+
+        # vectorize fbank extraction over the whole batch (rather than looping
+        # over waveforms) so that it runs as batched FFTs on `waveforms` device.
+        # randomness="different" lets `dither` draw independent noise for each
+        # waveform (as the loop did) instead of raising an error.
+        features = torch.vmap(
+            partial(
+                kaldi.fbank,
+                num_mel_bins=num_mel_bins,
+                frame_length=frame_length,
+                frame_shift=frame_shift,
+                dither=dither,
+                sample_frequency=self.sample_rate,
+                window_type="hamming",
+                use_energy=False,
+            ),
+            randomness="different",
+        )(waveforms)
 
         return features - torch.mean(features, dim=1, keepdim=True)
 
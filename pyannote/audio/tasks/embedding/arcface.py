@@ -52,6 +52,12 @@ class SupervisedRepresentationLearningWithArcFace(
     min_duration : float, optional
         Sample training chunks duration uniformely between `min_duration`
         and `duration`. Defaults to `duration` (i.e. fixed length chunks).
+    num_durations : int, optional
+        Sample training chunks duration among `num_durations` evenly spaced values
+        between `min_duration` and `duration` (instead of uniformly), so that the
+        model only sees a small number of different input shapes. This avoids
+        re-running shape-dependent kernel selection (e.g. cudnn.benchmark) for
+        almost every batch. Defaults to uniform sampling.
     num_classes_per_batch : int, optional
         Number of classes per batch. Defaults to 32.
     num_chunks_per_class : int, optional
@@ -84,6 +90,7 @@ class SupervisedRepresentationLearningWithArcFace(
         protocol: Protocol,
         min_duration: Optional[float] = None,
         duration: float = 2.0,
+        num_durations: Optional[int] = None,
         num_classes_per_batch: int = 32,
         num_chunks_per_class: int = 1,
         margin: float = 28.6,
@@ -94,8 +101,14 @@ class SupervisedRepresentationLearningWithArcFace(
         metric: Union[Metric, Sequence[Metric], Dict[str, Metric]] = None,
     ):
 
+        if num_durations is not None and num_durations < 1:
+            raise ValueError(
+                f"`num_durations` must be 1 or more (you used {num_durations})."
+            )
+
         self.num_chunks_per_class = num_chunks_per_class
         self.num_classes_per_batch = num_classes_per_batch
+        self.num_durations = num_durations
 
         self.margin = margin
         self.scale = scale
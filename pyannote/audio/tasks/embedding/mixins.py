@@ -127,6 +127,31 @@ class SupervisedRepresentationLearningTaskMixin:
             BinaryAUROC(compute_on_cpu=True),
         ]
 
+    def sample_batch_duration(self, rng) -> float:
+        """Sample duration of chunks of next training batch
+
+        Parameters
+        ----------
+        rng : random.Random
+            Random number generator
+
+        Returns
+        -------
+        batch_duration : float
+            Uniformly sampled between `min_duration` and `duration` or, when
+            `num_durations` is set, among that many evenly spaced values
+            between `min_duration` and `duration`.
+        """
+
+        if self.num_durations is None:
+            return rng.uniform(self.min_duration, self.duration)
+
+        if self.num_durations == 1:
+            return self.duration
+
+        step = (self.duration - self.min_duration) / (self.num_durations - 1)
+        return self.min_duration + rng.randrange(self.num_durations) * step
+
     def train__iter__(self):
         """Iterate over training samples
 
@@ -144,7 +169,7 @@ class SupervisedRepresentationLearningTaskMixin:
         classes = list(self.specifications.classes)
 
         # select batch-wise duration at random
-        batch_duration = rng.uniform(self.min_duration, self.duration)
+        batch_duration = self.sample_batch_duration(rng)
         num_samples = 0
 
         while True:
@@ -202,7 +227,7 @@ class SupervisedRepresentationLearningTaskMixin:
 
                     num_samples += 1
                     if num_samples == self.batch_size:
-                        batch_duration = rng.uniform(self.min_duration, self.duration)
+                        batch_duration = self.sample_batch_duration(rng)
                         num_samples = 0
 
     def train__len__(self):
@@ -1,10 +1,14 @@
+import shutil
+
 import numpy as np
 import pytest
 import pytorch_lightning as pl
-from pyannote.core import SlidingWindowFeature
+import soundfile as sf
+import torch
+from pyannote.core import Segment, SlidingWindow, SlidingWindowFeature
 from pyannote.database import FileFinder, get_protocol
 
-from pyannote.audio import Inference, Model
+from pyannote.audio import Audio, Inference, Model
 from pyannote.audio.core.task import Resolution
 from pyannote.audio.models.segmentation.debug import SimpleSegmentationModel
 from pyannote.audio.tasks import VoiceActivityDetection
@@ -94,3 +98,188 @@ def test_skip_aggregation(pretrained_model, dev_file):
     inference = Inference(pretrained_model, skip_aggregation=True)
     scores = inference(dev_file)
     assert len(scores.data.shape) == 3
+
+
+def test_aggregate_non_finite():
+    frames = SlidingWindow(start=0.0, duration=0.1, step=0.1)
+    chunks = SlidingWindow(start=0.0, duration=1.0, step=0.5)
+    data = np.ones((3, 10, 2), dtype=np.float32)
+    data[0, 5, 0] = np.nan
+    data[1, 2, 1] = np.inf
+    aggregated = Inference.aggregate(
+        SlidingWindowFeature(data, chunks), frames, missing=0.0
+    )
+    assert np.all(np.isfinite(aggregated.data))
+
+
+def test_crop_precomputed(trained):
+    protocol, model = trained
+    inference = Inference(model, batch_size=128)
+    dev_file = next(protocol.development())
+    output = inference.precompute(dev_file)
+    assert dev_file["uri"] in inference.precomputed
+
+    chunk = Segment(1.0, 3.0)
+    cropped = inference.crop(dev_file, chunk)
+    assert isinstance(cropped, SlidingWindowFeature)
+    np.testing.assert_array_equal(
+        cropped.data, output.crop(chunk, mode="loose", return_data=True)
+    )
+
+    # cropped output does not share memory with precomputed output
+    cropped.data[:] = -1.0
+    np.testing.assert_array_equal(
+        inference.crop(dev_file, chunk).data,
+        output.crop(chunk, mode="loose", return_data=True),
+    )
+
+    cropped = inference.crop(dev_file, chunk, duration=2.0)
+    np.testing.assert_array_equal(
+        cropped.data, output.crop(chunk, mode="loose", fixed=2.0, return_data=True)
+    )
+
+    # chunks entirely out of bounds repeat the first (or last) frame
+    end = output.sliding_window[len(output.data) - 1].end
+    for chunk in [Segment(-5.0, -3.0), Segment(end + 3.0, end + 5.0)]:
+        cropped = inference.crop(dev_file, chunk, duration=2.0)
+        np.testing.assert_array_equal(
+            cropped.data,
+            output.crop(chunk, mode="loose", fixed=2.0, return_data=True),
+        )
+
+
+def test_crop_precomputed_other_file(trained):
+    protocol, model = trained
+    inference = Inference(model, batch_size=128)
+    first = {"audio": "tests/data/dev00.wav", "uri": "same"}
+    second = {"audio": "tests/data/dev01.wav", "uri": "same"}
+    inference.precompute(first)
+
+    # another file with the same uri is not served precomputed output
+    chunk = Segment(1.0, 3.0)
+    expected = Inference(model, batch_size=128).crop(second, chunk)
+    np.testing.assert_array_equal(inference.crop(second, chunk).data, expected.data)
+
+    # in-memory waveforms cannot be told apart by their (default) uri
+    waveform, sample_rate = Audio()(first)
+    with pytest.raises(ValueError):
+        inference.precompute({"waveform": waveform, "sample_rate": sample_rate})
+
+
+def test_crop_precomputed_other_channel(trained, tmp_path):
+    protocol, model = trained
+    audio = Audio()
+    first, sample_rate = audio("tests/data/dev00.wav")
+    second, _ = audio("tests/data/dev01.wav")
+    num_samples = min(first.shape[1], second.shape[1])
+    stereo = torch.cat([first[:, :num_samples], second[:, :num_samples]])
+    path = tmp_path / "stereo.wav"
+    sf.write(path, stereo.T.numpy(), sample_rate)
+
+    inference = Inference(model, batch_size=128)
+    inference.precompute({"audio": path, "uri": "same", "channel": 0})
+
+    # another channel of the same file is not served precomputed output
+    second = {"audio": path, "uri": "same", "channel": 1}
+    chunk = Segment(1.0, 3.0)
+    expected = Inference(model, batch_size=128).crop(second, chunk)
+    np.testing.assert_array_equal(inference.crop(second, chunk).data, expected.data)
+
+
+class WaveformIsSharedInference(Inference):
+    def __call__(self, file, hook=None):
+        return file["waveform"].is_shared()
+
+
+def test_batch(trained):
+    protocol, model = trained
+    inference = Inference(model, batch_size=128)
+    files = ["tests/data/dev00.wav", "tests/data/dev01.wav"]
+    outputs = inference.batch(files, num_workers=2)
+    assert len(outputs) == len(files)
+    for file, output in zip(files, outputs):
+        np.testing.assert_allclose(output.data, inference(file).data, atol=1e-6)
+
+
+def test_batch_waveform(trained):
+    protocol, model = trained
+    inference = Inference(model, batch_size=128)
+    audio = Audio()
+    files = []
+    for path in ["tests/data/dev00.wav", "tests/data/dev01.wav"]:
+        waveform, sample_rate = audio(path)
+        files.append({"waveform": waveform, "sample_rate": sample_rate})
+    outputs = inference.batch(files, num_workers=2)
+    for file, output in zip(files, outputs):
+        np.testing.assert_allclose(output.data, inference(file).data, atol=1e-6)
+
+    # waveforms reach worker processes through shared memory
+    inference = WaveformIsSharedInference(model, batch_size=128)
+    assert inference.batch(files, num_workers=2) == [True, True]
+
+
+def test_iterate(trained):
+    protocol, model = trained
+    inference = Inference(model, batch_size=128)
+    files = ["tests/data/dev00.wav", "tests/data/dev01.wav", "tests/data/trn01.wav"]
+    outputs = list(inference.iterate(files, prefetch=1))
+    assert len(outputs) == len(files)
+    for file, output in zip(files, outputs):
+        np.testing.assert_array_equal(output.data, inference(file).data)
+
+    with pytest.raises(ValueError):
+        next(inference.iterate(files, prefetch=0))
+
+
+def test_crop_precomputed_float16(trained):
+    protocol, model = trained
+    inference = Inference(model, batch_size=128)
+    dev_file = next(protocol.development())
+    output = inference.precompute(dev_file, dtype=np.float16)
+    assert output.data.dtype == np.float16
+
+    cropped = inference.crop(dev_file, Segment(1.0, 3.0))
+    assert cropped.data.dtype == np.float32
+
+    # precomputing again with another dtype does not return previous output
+    inference = Inference(model, batch_size=128)
+    assert inference.precompute(dev_file).data.dtype == np.float32
+    output = inference.precompute(dev_file, dtype=np.float16)
+    assert output.data.dtype == np.float16
+    assert inference.precomputed[dev_file["uri"]].data.dtype == np.float16
+
+
+def test_precompute_cache_dir(trained, tmp_path):
+    protocol, model = trained
+    dev_file = next(protocol.development())
+    output = Inference(model, batch_size=128).precompute(dev_file, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob(f"{dev_file['uri']}.*.npz"))) == 1
+
+    # a new instance loads precomputed output from disk without running the model
+    inference = Inference(model, batch_size=128)
+    inference.infer = lambda chunks: pytest.fail("model should not be run")
+    cached = inference.precompute(dev_file, cache_dir=tmp_path)
+    np.testing.assert_array_equal(cached.data, output.data)
+    assert cached.sliding_window == output.sliding_window
+
+    # files sharing the same uri do not share cache entries
+    for audio in ["tests/data/dev00.wav", "tests/data/dev01.wav"]:
+        Inference(model, batch_size=128).precompute(
+            {"audio": audio, "uri": "same"}, cache_dir=tmp_path
+        )
+    assert len(list(tmp_path.glob("same.*.npz"))) == 2
+
+    # replacing audio file invalidates its cache entries
+    audio = tmp_path / "audio.wav"
+    file = {"audio": audio, "uri": "replaced"}
+    for source in ["tests/data/dev00.wav", "tests/data/dev01.wav"]:
+        shutil.copyfile(source, audio)
+        output = Inference(model, batch_size=128).precompute(file, cache_dir=tmp_path)
+        np.testing.assert_array_equal(
+            output.data, Inference(model, batch_size=128)(file).data
+        )
+    assert len(list(tmp_path.glob("replaced.*.npz"))) == 2
+
+    inference = Inference(model, pre_aggregation_hook=lambda scores: scores)
+    with pytest.raises(ValueError):
+        inference.precompute(dev_file, cache_dir=tmp_path)
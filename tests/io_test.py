@@ -1,3 +1,6 @@
+import os
+import shutil
+
 import torch
 import torchaudio
 from pyannote.core import Segment
@@ -84,3 +87,110 @@ def test_can_crop_from_file_like():
     assert isinstance(wav, Tensor)
     assert sr == 16000
     assert wav.shape[1] == 0.5 * 16000
+
+
+def test_crop_with_cache():
+    "Cropping from cached waveform gives the same result as seek-and-read"
+    test_file = "tests/data/dev00.wav"
+    segment = Segment(0.2, 0.7)
+    wav, sr = Audio(mono="downmix").crop(test_file, segment)
+
+    loader = Audio(mono="downmix", cache_size=1)
+    cached_wav, cached_sr = loader.crop(test_file, segment)
+    assert torch.equal(wav, cached_wav)
+    assert sr == cached_sr
+    assert len(loader._cache) == 1
+
+    loader.crop("tests/data/dev01.wav", segment)
+    assert len(loader._cache) == 1
+
+
+def test_cache_no_stale_data(tmp_path):
+    "Cached waveforms are neither served for a rewritten file nor aliased"
+    path = tmp_path / "audio.wav"
+    segment = Segment(0.0, 0.5)
+    loader = Audio(cache_size=1)
+
+    shutil.copy("tests/data/dev00.wav", path)
+    wav, _ = loader(str(path))
+    wav.zero_()
+    wav, _ = loader.crop(str(path), segment)
+    wav.zero_()
+    expected, _ = Audio().crop("tests/data/dev00.wav", segment)
+    assert torch.equal(loader.crop(str(path), segment)[0], expected)
+
+    shutil.copy("tests/data/dev01.wav", path)
+    os.utime(path, ns=(0, 0))
+    expected, _ = Audio().crop("tests/data/dev01.wav", segment)
+    assert torch.equal(loader.crop(str(path), segment)[0], expected)
+
+
+def test_crop_overlapping_chunks():
+    "Cropping overlapping chunks reuses previously read frames"
+    test_file = "tests/data/dev00.wav"
+    loader = Audio(mono="downmix", reuse_frames=True)
+    for start in [0.2, 0.4, 0.5, 1.2, 0.3]:
+        segment = Segment(start, start + 0.5)
+        wav, _ = loader.crop(test_file, segment)
+        expected, _ = Audio(mono="downmix").crop(test_file, segment)
+        assert torch.equal(wav, expected)
+
+
+def test_crop_does_not_keep_frames_by_default():
+    "Frames are only kept for reuse when asked to"
+    loader = Audio()
+    loader.crop("tests/data/dev00.wav", Segment(0.0, 0.5))
+    assert loader._last_read is None
+
+
+def test_crop_overlapping_chunks_no_stale_data(tmp_path):
+    "Reused frames are neither served for a rewritten file nor aliased"
+    path = tmp_path / "audio.wav"
+    segment = Segment(0.0, 0.5)
+    loader = Audio(reuse_frames=True)
+
+    shutil.copy("tests/data/dev00.wav", path)
+    wav, _ = loader.crop(str(path), segment)
+    wav.zero_()
+    expected, _ = Audio().crop("tests/data/dev00.wav", segment)
+    assert torch.equal(loader.crop(str(path), segment)[0], expected)
+
+    shutil.copy("tests/data/dev01.wav", path)
+    os.utime(path, ns=(0, 0))
+    expected, _ = Audio().crop("tests/data/dev01.wav", segment)
+    assert torch.equal(loader.crop(str(path), segment)[0], expected)
+
+
+def test_crop_batch():
+    audio = Audio()
+    file = "tests/data/dev00.wav"
+    segments = [Segment(0.0, 1.5), Segment(1.0, 2.5), Segment(4.0, 4.5)]
+    waveforms, sample_rate = audio.crop_batch(file, segments)
+    assert len(waveforms) == len(segments)
+    for segment, waveform in zip(segments, waveforms):
+        expected, expected_sample_rate = Audio().crop(file, segment)
+        assert sample_rate == expected_sample_rate
+        assert torch.equal(waveform, expected)
+
+
+def test_crop_batch_far_apart_segments():
+    "Segments far apart are read separately"
+    audio = Audio()
+    file = "tests/data/dev00.wav"
+    segments = [Segment(29.0, 29.5), Segment(0.0, 0.5), Segment(0.25, 0.75)]
+
+    num_read_frames = []
+    read_frames = audio._read_frames
+
+    def _read_frames(path, start_frame, num_frames):
+        num_read_frames.append(num_frames)
+        return read_frames(path, start_frame, num_frames)
+
+    audio._read_frames = _read_frames
+    waveforms, sample_rate = audio.crop_batch(file, segments)
+
+    assert len(num_read_frames) == 2
+    assert max(num_read_frames) < sample_rate
+    assert audio._last_read is None
+    for segment, waveform in zip(segments, waveforms):
+        assert torch.equal(waveform, Audio().crop(file, segment)[0])
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+from pyannote.database import FileFinder, get_protocol
+
+from pyannote.audio.tasks import SupervisedRepresentationLearningWithArcFace
+
+
+@pytest.fixture()
+def protocol():
+    return get_protocol(
+        "Debug.SpeakerDiarization.Debug", preprocessors={"audio": FileFinder()}
+    )
+
+
+def test_sample_batch_duration_num_durations(protocol):
+    task = SupervisedRepresentationLearningWithArcFace(
+        protocol, duration=2.0, min_duration=1.0, num_durations=3
+    )
+    rng = random.Random(0)
+    durations = {task.sample_batch_duration(rng) for _ in range(100)}
+    assert durations == {1.0, 1.5, 2.0}
+
+
+def test_sample_batch_duration_single_duration(protocol):
+    task = SupervisedRepresentationLearningWithArcFace(
+        protocol, duration=2.0, min_duration=1.0, num_durations=1
+    )
+    rng = random.Random(0)
+    assert {task.sample_batch_duration(rng) for _ in range(10)} == {2.0}
+
+
+@pytest.mark.parametrize("num_durations", [0, -1])
+def test_invalid_num_durations(protocol, num_durations):
+    with pytest.raises(ValueError):
+        SupervisedRepresentationLearningWithArcFace(
+            protocol, num_durations=num_durations
+        )
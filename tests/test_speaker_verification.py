@@ -0,0 +1,51 @@
+import pytest
+import torch
+import torchaudio.compliance.kaldi as kaldi
+
+from pyannote.audio.pipelines.speaker_verification import (
+    ONNXWeSpeakerPretrainedSpeakerEmbedding,
+)
+
+
+@pytest.fixture()
+def onnx_wespeaker():
+    # compute_fbank does not need the ONNX session: skip loading it
+    return ONNXWeSpeakerPretrainedSpeakerEmbedding.__new__(
+        ONNXWeSpeakerPretrainedSpeakerEmbedding
+    )
+
+
+def test_onnx_wespeaker_compute_fbank(onnx_wespeaker):
+    torch.manual_seed(0)
+    waveforms = 0.1 * torch.randn(3, 1, 32000)
+
+    fbank = onnx_wespeaker.compute_fbank(waveforms)
+
+    # per-waveform loop
+    features = torch.stack(
+        [
+            kaldi.fbank(
+                waveform,
+                num_mel_bins=80,
+                frame_length=25,
+                frame_shift=10,
+                dither=0.0,
+                sample_frequency=onnx_wespeaker.sample_rate,
+                window_type="hamming",
+                use_energy=False,
+            )
+            for waveform in waveforms * (1 << 15)
+        ]
+    )
+    expected = features - torch.mean(features, dim=1, keepdim=True)
+
+    assert fbank.shape == expected.shape
+    assert torch.allclose(fbank, expected, atol=1e-4)
+
+
+def test_onnx_wespeaker_compute_fbank_dither(onnx_wespeaker):
+    waveforms = torch.zeros(2, 1, 16000)
+    fbank = onnx_wespeaker.compute_fbank(waveforms, dither=1.0)
+    assert fbank.shape == onnx_wespeaker.compute_fbank(waveforms).shape
+    # each waveform gets its own dithering noise
+    assert not torch.equal(fbank[0], fbank[1])
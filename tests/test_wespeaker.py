@@ -0,0 +1,75 @@
+# MIT License
+#
+# Copyright (c) 2023- CNRS
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+import torch
+import torch.nn.functional as F
+
+from pyannote.audio.models.embedding.wespeaker import BaseWeSpeakerResNet
+from pyannote.audio.utils.receptive_field import conv1d_num_frames
+
+
+def avg_pool_centering(model, waveforms):
+    """Running average centering as computed with F.avg_pool1d"""
+
+    features = torch.vmap(model._fbank)(waveforms * (1 << 15))
+    span = model.hparams.fbank_centering_span
+    kernel_size = conv1d_num_frames(
+        num_samples=int(span * model.hparams.sample_rate),
+        kernel_size=400,
+        stride=160,
+        padding=0,
+        dilation=1,
+    )
+    return features - F.avg_pool1d(
+        features.transpose(1, 2),
+        kernel_size=2 * (kernel_size // 2) + 1,
+        stride=1,
+        padding=kernel_size // 2,
+        count_include_pad=False,
+    ).transpose(1, 2)
+
+
+@pytest.mark.parametrize(
+    "fbank_centering_span, batch_size, num_samples",
+    [
+        # centering span shorter than input
+        (0.5, 3, 32000),
+        # centering span longer than input
+        (3.0, 3, 16000),
+        # single-frame input
+        (0.5, 2, 400),
+        # single item batch
+        (0.5, 1, 24000),
+    ],
+)
+def test_fbank_running_centering(fbank_centering_span, batch_size, num_samples):
+    torch.manual_seed(0)
+    model = BaseWeSpeakerResNet(fbank_centering_span=fbank_centering_span)
+    waveforms = 0.1 * torch.randn(batch_size, 1, num_samples)
+
+    fbank = model.compute_fbank(waveforms)
+    expected = avg_pool_centering(model, waveforms)
+
+    assert fbank.shape == expected.shape
+    assert torch.allclose(fbank, expected, atol=1e-4)